@@ -1,7 +1,10 @@
+import textwrap
+import threading
+import markdown
 import streamlit as st
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 # --- CONFIGURATION & CONSTANTS ---
 PAGE_TITLE = "XGA Valuation Engine"
@@ -11,6 +14,7 @@ FOLD_TOTAL_SUPPLY = 2_000_000
 # XGA Constants
 XGA_TOTAL_SUPPLY = 270_000_000
 AIRDROP_RATIO = 5.0 # Fixed: 5 XGA per 1 FOLD
+AIRDROP_PER_CAP_DOLLAR = AIRDROP_RATIO / XGA_TOTAL_SUPPLY # Airdrop $ per FOLD per $1 of XGA MCAP
 
 SCENARIO_PRESETS: Dict[str, Dict[str, float]] = {
     "Conservative": {
@@ -32,12 +36,10 @@ SCENARIO_PRESETS: Dict[str, Dict[str, float]] = {
         "avg_bid_eth": 0.15,
     },
 }
-
-# --- PAGE SETUP ---
-st.set_page_config(page_title=PAGE_TITLE, layout="wide", page_icon="⚡")
+PRESET_OPTIONS = [*SCENARIO_PRESETS.keys(), "Custom"]
 
 # --- XGA BRANDED CSS (DEEP CONTRAST) ---
-st.markdown("""
+CSS_STRING = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;600;800&display=swap');
 
@@ -123,6 +125,54 @@ st.markdown("""
         display: block;
     }
     
+    /* CARD ROW (one HTML block per row of cards) */
+    .metric-row {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 16px;
+    }
+    .metric-row > .metric-card {
+        flex: 1 1 220px; /* wraps to stacked cards on narrow screens */
+        min-width: 0;
+    }
+    
+    /* YIELD SOURCE BANNER (Portfolio tab) */
+    .yield-banner {
+        background-color: rgba(0, 230, 118, 0.1);
+        padding: 15px;
+        border-radius: 8px;
+        border-left: 4px solid #00E676;
+        margin-bottom: 20px;
+    }
+    .yield-banner-title {
+        color: #00E676 !important;
+        font-weight: bold;
+    }
+    .yield-banner-body { font-size: 0.9rem; }
+    
+    /* INFO PANEL (static st.info look-alike, emitted as raw HTML) */
+    .info-panel {
+        background-color: rgba(28, 131, 225, 0.1);
+        border-radius: 8px;
+        padding: 16px;
+        margin-top: 8px;
+    }
+    
+    /* FAQ (native <details> accordion) */
+    .faq-item {
+        background-color: rgba(20, 20, 20, 0.9);
+        border: 1px solid #333;
+        border-radius: 8px;
+        padding: 12px 16px;
+        margin-bottom: 8px;
+    }
+    .faq-item summary {
+        color: #FFFFFF !important;
+        font-weight: 600;
+        cursor: pointer;
+    }
+    .faq-item[open] summary { margin-bottom: 8px; }
+    
     /* STREAMLIT WIDGET OVERRIDES */
     .stButton>button {
         background-color: #1a1a1a;
@@ -151,13 +201,22 @@ st.markdown("""
     }
     .disclaimer-box b { color: #FF9800 !important; }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# --- HELPER FUNCTIONS ---
+# --- PAGE SETUP ---
+st.set_page_config(page_title=PAGE_TITLE, layout="wide", page_icon="⚡")
+
+def inject_css() -> None:
+    # The one stylesheet for the app. Re-emitted every run: elements skipped on a
+    # rerun are removed from the page. A style-only st.html takes no layout space
+    # (streamlit>=1.45 routes it to the event container).
+    st.html(CSS_STRING)
 
-def safe_divide(numerator: float, denominator: float) -> float:
-    return numerator / denominator if denominator != 0 else 0.0
+inject_css()
 
+# --- HELPER FUNCTIONS ---
+
+@st.cache_data
 def calculate_vault_revenue_eth(
     market_share: float,
     adjustment_rate: float,
@@ -166,12 +225,163 @@ def calculate_vault_revenue_eth(
     kickback_rate: float,
     fold_share: float
 ) -> float:
-    total_slots = BLOCKS_PER_YEAR * market_share
-    adjustable = total_slots * adjustment_rate
-    successful = adjustable * success_rate
-    captured_value = successful * avg_bid
-    net_revenue = captured_value * (1.0 - kickback_rate)
-    return net_revenue * fold_share
+    # slots/yr * share * fill * bid, net of validator kickback, FOLD's cut
+    return market_share * adjustment_rate * success_rate * avg_bid * (BLOCKS_PER_YEAR * (1.0 - kickback_rate) * fold_share)
+
+@st.cache_data
+def sensitivity_prices(
+    adjustment_rate: float,
+    success_rate: float,
+    avg_bid: float,
+    kickback_rate: float,
+    fold_share: float,
+    eth_price: float,
+    pe_ratio: float,
+    is_usd: bool
+) -> pd.DataFrame:
+    # Implied price across market share 5%..50%, ready for st.line_chart.
+    # Plain NumPy on purpose: at 10 points a numba @njit kernel costs more in
+    # compile/cache lookup than it saves; revisit past ~1e5 points (e.g. Monte Carlo).
+    share_pct = np.arange(5, 55, 5)
+    ms_arr = share_pct / 100.0
+    k = BLOCKS_PER_YEAR * adjustment_rate * success_rate * avg_bid * (1.0 - kickback_rate) * fold_share
+    if is_usd:
+        k *= eth_price
+    prices = ms_arr * (k * pe_ratio / FOLD_TOTAL_SUPPLY)
+    return pd.DataFrame({"Price": prices}, index=pd.Index(share_pct, name="Share %"))
+
+@st.cache_data
+def compute_metrics(
+    market_share: float,
+    adjustment_rate: float,
+    success_rate: float,
+    avg_bid: float,
+    kickback_rate: float,
+    fold_share: float,
+    eth_price: float,
+    pe_ratio: float,
+    current_price: float,
+    staked_amt: float,
+    is_usd: bool
+) -> Dict[str, float]:
+    vault_rev_eth = calculate_vault_revenue_eth(
+        market_share, adjustment_rate, success_rate, avg_bid, kickback_rate, fold_share
+    )
+
+    # Currency Conversion Logic
+    if is_usd:
+        vault_rev_display = vault_rev_eth * eth_price
+        current_val_ref = current_price
+    else:
+        vault_rev_display = vault_rev_eth
+        current_val_ref = (current_price / eth_price) if eth_price else 0.0
+
+    # Zero-guard only the user-controlled denominators; FOLD_TOTAL_SUPPLY is a constant
+    yield_per_token = (vault_rev_display / staked_amt) if staked_amt else 0.0
+    implied_mcap = vault_rev_display * pe_ratio
+    implied_price = implied_mcap / FOLD_TOTAL_SUPPLY
+
+    return {
+        "vault_rev_display": vault_rev_display,
+        "yield_per_token": yield_per_token,
+        "implied_price": implied_price,
+        "div_yield": (yield_per_token / current_val_ref) if current_val_ref else 0.0,
+        "upside": ((implied_price - current_val_ref) / current_val_ref * 100) if current_val_ref else 0.0,
+    }
+
+@st.cache_data(max_entries=64)
+def xga_valuation(mcap_m: int, user_fold: float, base_capital: float) -> Dict[str, float]:
+    xga_mcap = mcap_m * 1_000_000
+
+    # Retroactive Airdrop (Fixed 5x)
+    est_airdrop_tokens = user_fold * AIRDROP_RATIO
+
+    return {
+        # Display prices in integer cents (rounded half-up) to skip float formatting
+        "xga_price_cents": (2 * xga_mcap * 100 + XGA_TOTAL_SUPPLY) // (2 * XGA_TOTAL_SUPPLY),
+        "five_price_cents": (2 * 5 * xga_mcap * 100 + XGA_TOTAL_SUPPLY) // (2 * XGA_TOTAL_SUPPLY),
+        "est_airdrop_tokens": est_airdrop_tokens,
+        "est_airdrop_value": user_fold * AIRDROP_PER_CAP_DOLLAR * xga_mcap,
+        # Active Incentive Value
+        "est_incentive_value": base_capital * 3.40, # Fixed 340%
+    }
+
+@st.cache_resource
+def _md_renderer() -> Tuple[markdown.Markdown, threading.Lock]:
+    # One Markdown instance per process (extension grammars built once); it is
+    # stateful, so sessions share it behind a lock
+    return markdown.Markdown(extensions=["extra"]), threading.Lock()
+
+@st.cache_data
+def render_md(src: str) -> str:
+    # Static Markdown -> HTML once, so the browser skips its Markdown parse each rerun
+    md, lock = _md_renderer()
+    with lock:
+        return md.reset().convert(textwrap.dedent(src))
+
+def _cents_to_str(cents: int) -> str:
+    return f"{cents // 100}.{cents % 100:02d}"
+
+def card(label: str, value: str, sub: str = "", value_class: str = "money-green") -> str:
+    sub_html = f'<br><span class="card-sub">{sub}</span>' if sub else ""
+    return (
+        f'<div class="metric-card"><span class="card-label">{label}</span><br>'
+        f'<span class="{value_class}">{value}</span>{sub_html}</div>'
+    )
+
+def card_row_html(*cards: str) -> str:
+    return f'<div class="metric-row">{"".join(cards)}</div>'
+
+def card_row(*cards: str) -> None:
+    # Raw HTML, so st.html (no Markdown pass) rather than st.markdown
+    st.html(card_row_html(*cards))
+
+# --- STATIC CONTENT (pre-rendered HTML) ---
+FAQ_LIDO_HTML = render_md("""
+    **Status: Final Stages.**
+    In the Oct 14th call, Sam stated Manifold is a "Launch Partner" for Lido V3. 
+    Integration depends on the Lido V3 mainnet launch (expected with Pectra).
+""")
+
+FAQ_COMMIT_BOOST_HTML = render_md("""
+    **It's a Sidecar.**
+    Commit-Boost allows validators to run XGA alongside MEV-Boost.
+    They get paid TWICE: once for the XGA slot, and once for the rest of the block (Flashbots).
+""")
+
+FAQ_SUPPLY_HTML = render_md("""
+    **Tokenomics:**
+    Sam confirmed 270M total supply for the XGA incentive token. 
+    It is designed to bootstrap liquidity. 10% of Protocol Revenue goes to XGA holders/DAO, 
+    while 90% goes to FOLD holders (Insurance Vault).
+""")
+
+XGA_PARAMS_HTML = (
+    '<b>INCENTIVE PARAMETERS</b>'
+    '<div class="info-panel">Applies <b>340% ROI</b> (3-month active participation) to your capital base.</div>'
+)
+
+# Native <details> items: open/close happens in the browser, no widgets or reruns
+FAQ_HTML = "".join(
+    f'<details class="faq-item"><summary>{question}</summary>{answer_html}</details>'
+    for question, answer_html in [
+        ("❓ Is the Lido Partnership Confirmed?", FAQ_LIDO_HTML),
+        ("❓ How does Commit-Boost work?", FAQ_COMMIT_BOOST_HTML),
+        ("❓ What about the 270M XGA Supply?", FAQ_SUPPLY_HTML),
+    ]
+)
+
+# Rendered once; only {price}/{cap}/{five_price} are filled in per run
+IMPLIED_TMPL = render_md("""
+    **The 'Option' Thesis:**
+    Sam has mentioned FOLD has an "implied value of $5." This matches the math of the Airdrop:
+
+    * **XGA Price:** ${price} (at ${cap}M Cap)
+    * **Ratio:** 5 XGA per FOLD
+    * **Value:** 5 * ${price} = **${five_price} Value per FOLD**
+
+    This effectively acts as a "floor price" or call option for holders who receive the airdrop.
+""")
 
 def update_from_preset():
     selected = st.session_state["preset_selector"]
@@ -179,6 +389,10 @@ def update_from_preset():
         for key, value in SCENARIO_PRESETS[selected].items():
             st.session_state[key] = value
 
+def update_base_capital():
+    # Holdings valued at the reference price; recomputed only when the sidebar form is applied
+    st.session_state["base_capital"] = st.session_state["user_fold"] * st.session_state["current_price"]
+
 # --- INITIALIZATION ---
 if "initialized" not in st.session_state:
     defaults = SCENARIO_PRESETS["Realistic"]
@@ -195,6 +409,10 @@ if "initialized" not in st.session_state:
     st.session_state["currency_mode"] = "USD ($)"
     st.session_state["initialized"] = True
 
+# Seeded outside the init guard so sessions initialized before this key existed still get it
+if "base_capital" not in st.session_state:
+    update_base_capital()
+
 # --- SIDEBAR CONTROLS ---
 with st.sidebar:
     st.markdown("## ⚡ **XGA** | CONTROLS")
@@ -206,11 +424,11 @@ with st.sidebar:
     is_usd = st.session_state["currency_mode"] == "USD ($)"
     sym = "$" if is_usd else "Ξ"
 
-    # 2. Preset
+    # 2. Preset (outside the form: forms don't allow on_change callbacks)
     st.markdown("### SCENARIOS")
     st.selectbox(
         "Load Preset",
-        options=list(SCENARIO_PRESETS.keys()) + ["Custom"],
+        options=PRESET_OPTIONS,
         index=1,
         key="preset_selector",
         on_change=update_from_preset,
@@ -219,37 +437,41 @@ with st.sidebar:
     
     st.markdown("---")
 
-    # 3. Market Data
-    st.markdown("### MARKET DATA")
-    st.number_input("ETH Price ($)", min_value=0.0, step=50.0, key="eth_price")
+    # Batched: widgets below only trigger a rerun when "Apply" is pressed
+    with st.form("controls"):
+        # 3. Market Data
+        st.markdown("### MARKET DATA")
+        st.number_input("ETH Price ($)", min_value=0.0, step=50.0, key="eth_price")
     
-    st.checkbox("Enforce 400k Launch Cap", key="staked_lock")
-    if st.session_state["staked_lock"]:
-        st.session_state["staked_pct"] = 20
-        st.caption("🔒 Staking Capped at 20% (400k FOLD)")
-    else:
-        st.slider("Total % FOLD Staked", 0, 100, key="staked_pct")
+        st.checkbox("Enforce 400k Launch Cap", key="staked_lock")
+        if st.session_state["staked_lock"]:
+            st.session_state["staked_pct"] = 20
+            st.caption("🔒 Staking Capped at 20% (400k FOLD)")
+        else:
+            st.slider("Total % FOLD Staked", 0, 100, key="staked_pct")
 
-    # GLOBAL USER INPUT
-    st.markdown("---")
-    st.markdown("### MY POSITION")
-    st.number_input("FOLD Holdings", min_value=0.0, step=100.0, key="user_fold")
+        # GLOBAL USER INPUT
+        st.markdown("---")
+        st.markdown("### MY POSITION")
+        st.number_input("FOLD Holdings", min_value=0.0, step=100.0, key="user_fold")
 
-    st.markdown("---")
+        st.markdown("---")
 
-    # 4. Assumptions
-    st.markdown("### PROTOCOL ASSUMPTIONS")
-    st.slider("Market Share %", 0, 50, key="market_share_pct")
-    st.slider("Adjustment Rate %", 0, 100, key="adjustment_rate_pct")
-    st.slider("Success Rate %", 0, 100, key="success_rate_pct")
-    st.number_input("Avg. Bid Delta (ETH)", min_value=0.0, format="%.3f", key="avg_bid_eth")
+        # 4. Assumptions
+        st.markdown("### PROTOCOL ASSUMPTIONS")
+        st.slider("Market Share %", 0, 50, key="market_share_pct")
+        st.slider("Adjustment Rate %", 0, 100, key="adjustment_rate_pct")
+        st.slider("Success Rate %", 0, 100, key="success_rate_pct")
+        st.number_input("Avg. Bid Delta (ETH)", min_value=0.0, format="%.3f", key="avg_bid_eth")
 
-    st.markdown("---")
+        st.markdown("---")
+
+        # 5. Valuation
+        st.markdown("### VALUATION")
+        st.slider("Target P/E Ratio", 5, 60, key="pe_ratio")
+        st.number_input("Ref. FOLD Price ($)", min_value=0.0, step=0.05, key="current_price")
 
-    # 5. Valuation
-    st.markdown("### VALUATION")
-    st.slider("Target P/E Ratio", 5, 60, key="pe_ratio")
-    st.number_input("Ref. FOLD Price ($)", min_value=0.0, step=0.05, key="current_price")
+        st.form_submit_button("Apply", on_click=update_base_capital, use_container_width=True)
 
     st.markdown("""
     <div class="disclaimer-box">
@@ -260,44 +482,37 @@ with st.sidebar:
 
 # --- MAIN LOGIC ---
 
+# 0. Bind Session State Once
+S = st.session_state
+avg_bid = float(S["avg_bid_eth"])
+eth_p = float(S["eth_price"])
+pe = S["pe_ratio"]
+current_price = float(S["current_price"])
+user_fold = S["user_fold"]
+base_capital = S["base_capital"]
+
 # 1. Normalize Inputs
-ms = st.session_state["market_share_pct"] / 100.0
-ar = st.session_state["adjustment_rate_pct"] / 100.0
-sr = st.session_state["success_rate_pct"] / 100.0
+ms = S["market_share_pct"] / 100.0
+ar = S["adjustment_rate_pct"] / 100.0
+sr = S["success_rate_pct"] / 100.0
 eff_fill = ar * sr
 
-kr = st.session_state["kickback_pct"] / 100.0 if "kickback_pct" in st.session_state else 0.30
-fs = st.session_state["fold_share_pct"] / 100.0 if "fold_share_pct" in st.session_state else 0.90
+kr = S["kickback_pct"] / 100.0 if "kickback_pct" in S else 0.30
+fs = S["fold_share_pct"] / 100.0 if "fold_share_pct" in S else 0.90
 
-staked_amt = FOLD_TOTAL_SUPPLY * (st.session_state["staked_pct"] / 100.0)
+staked_amt = FOLD_TOTAL_SUPPLY * (S["staked_pct"] / 100.0)
 
-# 2. Calculate Revenue (ETH)
-vault_rev_eth = calculate_vault_revenue_eth(
-    ms, ar, sr, st.session_state["avg_bid_eth"], kr, fs
+# 2. Revenue, Currency Conversion & Yield (cached on the input tuple)
+metrics = compute_metrics(
+    ms, ar, sr, avg_bid, kr, fs, eth_p, float(pe), current_price, staked_amt, is_usd
 )
-
-# 3. Currency Conversion Logic
-eth_p = st.session_state["eth_price"]
-
-if is_usd:
-    vault_rev_display = vault_rev_eth * eth_p
-    yield_per_token = safe_divide(vault_rev_display, staked_amt)
-    implied_mcap = vault_rev_display * st.session_state["pe_ratio"]
-    implied_price = safe_divide(implied_mcap, FOLD_TOTAL_SUPPLY)
-    current_val_ref = st.session_state["current_price"]
-else:
-    vault_rev_display = vault_rev_eth
-    yield_per_token = safe_divide(vault_rev_eth, staked_amt)
-    implied_mcap = vault_rev_eth * st.session_state["pe_ratio"]
-    implied_price = safe_divide(implied_mcap, FOLD_TOTAL_SUPPLY)
-    current_val_ref = safe_divide(st.session_state["current_price"], eth_p)
-
-# Yield Calc
-div_yield = safe_divide(yield_per_token, current_val_ref)
-upside = safe_divide(implied_price - current_val_ref, current_val_ref) * 100
+vault_rev_display = metrics["vault_rev_display"]
+yield_per_token = metrics["yield_per_token"]
+implied_price = metrics["implied_price"]
+div_yield = metrics["div_yield"]
+upside = metrics["upside"]
 
 # User Specifics
-user_fold = st.session_state["user_fold"]
 my_income_annual = user_fold * yield_per_token
 my_portfolio_val = user_fold * implied_price
 
@@ -318,48 +533,17 @@ tab_dash, tab_prof, tab_xga, tab_faq = st.tabs([
 with tab_dash:
     st.markdown("#### PROTOCOL HEALTH")
     
-    m1, m2, m3, m4 = st.columns(4)
-    
     # Formatting Logic
     fmt = ",.2f" if is_usd else ",.4f"
     label_rev = f"{sym}{vault_rev_display/1_000_000:.1f}M" if is_usd else f"{sym}{vault_rev_display:,.0f}"
     
     # Using Custom Card HTML for consistency
-    with m1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">Vault Revenue (Annual)</span><br>
-            <span class="money-green">{label_rev}</span><br>
-            <span class="card-sub">Net to Insurance Vault</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with m2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">Dividend / Token</span><br>
-            <span class="money-green">{sym}{yield_per_token:{fmt}}</span><br>
-            <span class="card-sub">Cash flow per Staked FOLD</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with m3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">Implied Price</span><br>
-            <span class="valuation-purple">{sym}{implied_price:{fmt}}</span><br>
-            <span class="card-sub">Based on {st.session_state['pe_ratio']}x P/E</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with m4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">Yield APY</span><br>
-            <span class="valuation-purple">{div_yield:.1%}</span><br>
-            <span class="card-sub">Upside: {upside:,.0f}%</span>
-        </div>
-        """, unsafe_allow_html=True)
+    card_row(
+        card("Vault Revenue (Annual)", label_rev, "Net to Insurance Vault"),
+        card("Dividend / Token", f"{sym}{yield_per_token:{fmt}}", "Cash flow per Staked FOLD"),
+        card("Implied Price", f"{sym}{implied_price:{fmt}}", f"Based on {pe}x P/E", "valuation-purple"),
+        card("Yield APY", f"{div_yield:.1%}", f"Upside: {upside:,.0f}%", "valuation-purple"),
+    )
 
     st.divider()
 
@@ -368,24 +552,18 @@ with tab_dash:
     with c1:
         st.markdown("#### SENSITIVITY: MARKET SHARE")
         st.caption("How price reacts to adoption")
-        ms_range = range(5, 55, 5)
-        prices = []
-        for x in ms_range:
-            r_eth = calculate_vault_revenue_eth(x/100, ar, sr, st.session_state["avg_bid_eth"], kr, fs)
-            r_val = r_eth * eth_p if is_usd else r_eth
-            mcap = r_val * st.session_state["pe_ratio"]
-            prices.append(safe_divide(mcap, FOLD_TOTAL_SUPPLY))
-        st.line_chart(pd.DataFrame({"Share %": ms_range, "Price": prices}).set_index("Share %"))
+        st.line_chart(sensitivity_prices(
+            ar, sr, avg_bid, kr, fs, eth_p, float(pe), is_usd
+        ))
 
     with c2:
         st.markdown("#### 36-MONTH RAMP")
         st.caption("Projected revenue growth")
-        ramp_data = []
-        for m in [1, 12, 24, 36]:
-            factor = np.interp(m, [1, 36], [0.1, 1.0])
-            ramp_rev = vault_rev_display * factor
-            ramp_data.append({"Month": m, "Revenue": ramp_rev})
-        st.bar_chart(pd.DataFrame(ramp_data).set_index("Month"))
+        # Linear ramp from 10% of run-rate at month 1 to 100% at month 36
+        months = np.array([1, 12, 24, 36])
+        factors = 0.1 + (months - 1) * (0.9 / 35)
+        ramp_rev = vault_rev_display * factors
+        st.bar_chart(pd.DataFrame({"Revenue": ramp_rev}, index=pd.Index(months, name="Month")))
 
 # ==========================================
 # TAB 2: MY PORTFOLIO (RENAMED)
@@ -394,143 +572,93 @@ with tab_prof:
     st.markdown(f"#### INCOME PROJECTOR ({user_fold:,.0f} FOLD)")
     
     st.markdown("""
-    <div style="background-color: rgba(0, 230, 118, 0.1); padding: 15px; border-radius: 8px; border-left: 4px solid #00E676; margin-bottom: 20px;">
-        <span style="color: #00E676; font-weight: bold;">💸 SOURCE OF YIELD: CAPTIVE INSURANCE</span><br>
-        <span style="color: #E0E0E0; font-size: 0.9rem;">
+    <div class="yield-banner">
+        <span class="yield-banner-title">💸 SOURCE OF YIELD: CAPTIVE INSURANCE</span><br>
+        <span class="yield-banner-body">
         This income is an insurance premium paid to you for staking FOLD in the <b>Captive Insurance Vault</b>. 
         You are underwriting the risk of XGA failure.
         </span>
     </div>
     """, unsafe_allow_html=True)
     
-    col_kpi1, col_kpi2, col_kpi3 = st.columns(3)
-    
-    with col_kpi1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">MONTHLY INCOME</span><br>
-            <span class="money-green">{sym}{my_income_annual/12:{fmt}}</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with col_kpi2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">ANNUAL INCOME</span><br>
-            <span class="money-green">{sym}{my_income_annual:{fmt}}</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with col_kpi3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">PROJECTED VALUE</span><br>
-            <span class="valuation-purple">{sym}{my_portfolio_val:{fmt}}</span>
-        </div>
-        """, unsafe_allow_html=True)
+    if user_fold == 0:
+        st.info("Enter FOLD balance in sidebar to see projections.")
+    else:
+        card_row(
+            card("MONTHLY INCOME", f"{sym}{my_income_annual/12:{fmt}}"),
+            card("ANNUAL INCOME", f"{sym}{my_income_annual:{fmt}}"),
+            card("PROJECTED VALUE", f"{sym}{my_portfolio_val:{fmt}}", value_class="valuation-purple"),
+        )
 
 # ==========================================
 # TAB 3: XGA REWARDS (BRANDED)
 # ==========================================
-with tab_xga:
+# Fragment: moving the XGA slider reruns only this function, not every tab
+@st.fragment
+def _render_xga(user_fold: float, base_capital: float) -> None:
     st.markdown("#### XGA INCENTIVE CALCULATOR")
     
     # 1. Inputs
+    # Only the slider needs a Streamlit widget; the right-hand column is one static HTML block
     col_x1, col_x2 = st.columns([1, 2])
     with col_x1:
-        st.markdown("**TARGET MARKET CAP ($M)**")
-        xga_mcap_input = st.slider(
-            "Target MCAP", 
-            min_value=100, max_value=900, value=300, step=50,
-            label_visibility="collapsed"
-        )
-        xga_mcap = xga_mcap_input * 1_000_000
-        xga_price = xga_mcap / XGA_TOTAL_SUPPLY
+        # Commit-on-apply: dragging the slider doesn't rerun until "Apply" is pressed
+        with st.form("xga_controls"):
+            xga_mcap_input = st.slider(
+                "**TARGET MARKET CAP ($M)**", 
+                min_value=100, max_value=900, value=300, step=50
+            )
+            st.form_submit_button("Apply", use_container_width=True)
     
-    with col_x2:
-        st.markdown("**INCENTIVE PARAMETERS**")
-        st.info("Applies **340% ROI** (3-month active participation) to your capital base.")
+    col_x2.html(XGA_PARAMS_HTML)
 
     st.divider()
 
-    # 2. Math
-    # Retroactive Airdrop (Fixed 5x)
-    est_airdrop_tokens = user_fold * AIRDROP_RATIO
-    est_airdrop_value = est_airdrop_tokens * xga_price
-    
-    # Active Incentive Value
-    base_capital = user_fold * st.session_state["current_price"]
-    est_incentive_value = base_capital * 3.40 # Fixed 340%
+    # Same inputs as this session's last render: re-emit the stored HTML as-is
+    xga_key = (xga_mcap_input, float(user_fold), float(base_capital))
+    if st.session_state.get("_xga_last_key") != xga_key:
+        # 2. Math (cached on mcap/holdings/capital)
+        xga = xga_valuation(*xga_key)
+        est_airdrop_tokens = xga["est_airdrop_tokens"]
+        est_airdrop_value = xga["est_airdrop_value"]
+        est_incentive_value = xga["est_incentive_value"]
+
+        # 3. Display (each number formatted once, shared by cards and expander)
+        price_str = _cents_to_str(xga["xga_price_cents"])
+        cap_str = str(xga_mcap_input)
+        airdrop_str = f"{est_airdrop_value:,.2f}"
+        tokens_str = f"{est_airdrop_tokens:,.0f}"
+        incentive_str = f"{est_incentive_value:,.2f}"
+
+        st.session_state["_xga_last_html"] = (
+            card_row_html(
+                card("IMPLIED XGA PRICE", f"${price_str}", f"${cap_str}M Cap / 270M Supply", "valuation-purple"),
+                card("AIRDROP VALUE", f"${airdrop_str}", f"{tokens_str} XGA (5x Fixed)"),
+                card("INCENTIVE VALUE", f"${incentive_str}", "340% ROI (3 Mo)"),
+            ),
+            IMPLIED_TMPL.format_map({
+                "price": price_str,
+                "cap": cap_str,
+                "five_price": _cents_to_str(xga["five_price_cents"]),
+            }),
+        )
+        st.session_state["_xga_last_key"] = xga_key
 
-    # 3. Display
-    xc1, xc2, xc3 = st.columns(3)
-    
-    with xc1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">IMPLIED XGA PRICE</span><br>
-            <span class="valuation-purple">${xga_price:.2f}</span><br>
-            <span class="card-sub">${xga_mcap_input}M Cap / 270M Supply</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with xc2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">AIRDROP VALUE</span><br>
-            <span class="money-green">${est_airdrop_value:,.2f}</span><br>
-            <span class="card-sub">{est_airdrop_tokens:,.0f} XGA (5x Fixed)</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with xc3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <span class="card-label">INCENTIVE VALUE</span><br>
-            <span class="money-green">${est_incentive_value:,.2f}</span><br>
-            <span class="card-sub">340% ROI (3 Mo)</span>
-        </div>
-        """, unsafe_allow_html=True)
+    cards_html, implied_html = st.session_state["_xga_last_html"]
+    st.html(cards_html)
 
     with st.expander("🧮 The 'Implied Value' Explained"):
-        st.markdown(f"""
-        **The 'Option' Thesis:**
-        Sam has mentioned FOLD has an "implied value of $5." This matches the math of the Airdrop:
-        
-        * **XGA Price:** ${xga_price:.2f} (at ${xga_mcap_input}M Cap)
-        * **Ratio:** 5 XGA per FOLD
-        * **Value:** 5 * ${xga_price:.2f} = **${5 * xga_price:.2f} Value per FOLD**
-        
-        This effectively acts as a "floor price" or call option for holders who receive the airdrop.
-        """)
+        st.html(implied_html)
+
+with tab_xga:
+    _render_xga(user_fold, base_capital)
 
 # ==========================================
 # TAB 4: FAQ (CLEAN)
 # ==========================================
 with tab_faq:
     st.markdown("#### RESOURCES")
-    
-    with st.expander("❓ Is the Lido Partnership Confirmed?"):
-        st.write("""
-        **Status: Final Stages.**
-        In the Oct 14th call, Sam stated Manifold is a "Launch Partner" for Lido V3. 
-        Integration depends on the Lido V3 mainnet launch (expected with Pectra).
-        """)
-        
-    with st.expander("❓ How does Commit-Boost work?"):
-        st.write("""
-        **It's a Sidecar.**
-        Commit-Boost allows validators to run XGA alongside MEV-Boost.
-        They get paid TWICE: once for the XGA slot, and once for the rest of the block (Flashbots).
-        """)
-        
-    with st.expander("❓ What about the 270M XGA Supply?"):
-        st.write("""
-        **Tokenomics:**
-        Sam confirmed 270M total supply for the XGA incentive token. 
-        It is designed to bootstrap liquidity. 10% of Protocol Revenue goes to XGA holders/DAO, 
-        while 90% goes to FOLD holders (Insurance Vault).
-        """)
+    st.html(FAQ_HTML)
 
 # --- FOOTER ---
 st.markdown("---")